@@ -44,5 +44,6 @@ PROCESSING_CONFIG = {
     "missing_value_threshold": 0.1,
     "outlier_method": "iqr",
     "date_columns": ["year", "date", "period"],
+    "date_format": "%Y-%m-%d",
     "numeric_precision": 2
 }
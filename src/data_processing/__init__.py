@@ -2,19 +2,93 @@
 Data processing utilities for AgroDataZoom project.
 """
 
+import os
+import re
+import functools
+import tempfile
+import importlib.util
 import pandas as pd
 import numpy as np
 from pathlib import Path
 import logging
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from ..config.config import PROCESSING_CONFIG
+from ..utils import PROVINCE_DTYPE, province_codes
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    # The pyarrow CSV parser rejects some files the default parser accepts,
+    # e.g. quoted fields containing newlines or short rows. Recent pandas
+    # re-raises ArrowInvalid as ParserError.
+    _CSV_FALLBACK_ERRORS = (ImportError, pa.ArrowInvalid, pd.errors.ParserError)
+except ImportError:
+    _CSV_FALLBACK_ERRORS = (ImportError,)
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+# Keep Arrow-backed columns end to end when pandas (>= 2.0) and pyarrow support it
+if int(pd.__version__.split('.')[0]) >= 2 and importlib.util.find_spec('pyarrow') is not None:
+    _READ_KWARGS = {'dtype_backend': 'pyarrow'}
+else:
+    _READ_KWARGS = {}
+
+# Frames shorter than this use the pandas path, kernel dispatch would dominate
+_NUMBA_MIN_SIZE = 100_000
+
+if _HAVE_NUMBA:
+    @njit(cache=True)
+    def _province_agg(codes, values, k):
+        # Dense per-province accumulators; Welford's update gives mean and
+        # variance in the same pass. Code -1 (unknown) and NaN values are skipped.
+        rows = np.zeros(k, dtype=np.int64)
+        count = np.zeros(k, dtype=np.int64)
+        sums = np.zeros(k)
+        means = np.zeros(k)
+        m2 = np.zeros(k)
+        for i in range(codes.shape[0]):
+            c = codes[i]
+            if c < 0:
+                continue
+            rows[c] += 1
+            v = values[i]
+            if np.isnan(v):
+                continue
+            count[c] += 1
+            sums[c] += v
+            delta = v - means[c]
+            means[c] += delta / count[c]
+            m2[c] += delta * (v - means[c])
+        mean_out = np.full(k, np.nan)
+        std_out = np.full(k, np.nan)
+        for c in range(k):
+            if count[c] > 0:
+                mean_out[c] = means[c]
+            if count[c] > 1:
+                std_out[c] = np.sqrt(m2[c] / (count[c] - 1))
+        return rows, sums, mean_out, std_out
+
+# Runs of spaces/hyphens collapsed to a single underscore in column names
+_COLNAME_RE = re.compile(r'[ \-]+')
+
+@functools.lru_cache(maxsize=256)
+def _normalize_cols(cols: Tuple) -> Tuple[str, ...]:
+    """Standardize a header once per distinct schema (files often share a template)."""
+    return tuple(_COLNAME_RE.sub('_', str(c)).lower() for c in cols)
 
 class DataProcessor:
     """Base class for data processing operations."""
     
     def __init__(self):
         self.config = PROCESSING_CONFIG
+        self._missing_threshold = self.config["missing_value_threshold"]
+        self._date_cols = tuple(self.config["date_columns"])
+        self._date_format = self.config["date_format"]
         self.logger = logging.getLogger(__name__)
     
     def clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -27,14 +101,29 @@ class DataProcessor:
         Returns:
             Cleaned dataframe
         """
+        date_cols = [col for col in self._date_cols if col in df.columns]
+        
         # Handle missing values
-        missing_threshold = self.config["missing_value_threshold"]
-        df = df.dropna(thresh=int(len(df) * (1 - missing_threshold)))
+        n_rows, n_cols = df.shape
+        thresh = int(n_rows * (1 - self._missing_threshold))
+        na_mask = df.isna()
+        if na_mask.to_numpy().any():
+            # Same rule as dropna(thresh=...), reusing the mask computed above
+            df = df.loc[n_cols - na_mask.sum(axis=1) >= thresh].copy()
+        elif n_cols < thresh:
+            # No missing values, but rows are still too narrow for the threshold
+            df = df.iloc[:0].copy()
+        elif date_cols:
+            # Nothing dropped; copy so the date conversion leaves the caller's frame intact
+            df = df.copy()
         
         # Convert date columns
-        for col in self.config["date_columns"]:
-            if col in df.columns:
-                df[col] = pd.to_datetime(df[col], errors='coerce')
+        for col in date_cols:
+            try:
+                df[col] = pd.to_datetime(df[col], format=self._date_format, errors='raise', cache=True)
+            except (ValueError, TypeError):
+                # Values not in the configured format, fall back to per-value inference
+                df[col] = pd.to_datetime(df[col], errors='coerce', cache=True)
         
         return df
     
@@ -48,7 +137,7 @@ class DataProcessor:
         Returns:
             Dataframe with standardized column names
         """
-        df.columns = df.columns.str.lower().str.replace(' ', '_').str.replace('-', '_')
+        df.columns = _normalize_cols(tuple(df.columns))
         return df
     
     def detect_outliers(self, df: pd.DataFrame, column: str) -> pd.Series:
@@ -62,14 +151,20 @@ class DataProcessor:
         Returns:
             Boolean series indicating outliers
         """
-        Q1 = df[column].quantile(0.25)
-        Q3 = df[column].quantile(0.75)
+        values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        if values.size == 0:
+            # nanquantile returns a scalar NaN for empty input
+            return pd.Series(np.zeros(0, dtype=bool), index=df.index, name=column)
+        
+        # Both quartiles from a single partition; NaNs are skipped like Series.quantile
+        Q1, Q3 = np.nanquantile(values, (0.25, 0.75))
         IQR = Q3 - Q1
         
         lower_bound = Q1 - 1.5 * IQR
         upper_bound = Q3 + 1.5 * IQR
         
-        return (df[column] < lower_bound) | (df[column] > upper_bound)
+        mask = (values < lower_bound) | (values > upper_bound)
+        return pd.Series(mask, index=df.index, name=column)
 
 class TuikDataProcessor(DataProcessor):
     """Specialized processor for TÜİK data."""
@@ -89,15 +184,30 @@ class TuikDataProcessor(DataProcessor):
         """
         try:
             # Read the file (usually Excel for TÜİK)
-            if str(file_path).endswith('.xlsx') or str(file_path).endswith('.xls'):
-                df = pd.read_excel(file_path)
+            is_excel = str(file_path).endswith('.xlsx') or str(file_path).endswith('.xls')
+            # Keep the full name so that x.xls and x.xlsx get separate sidecars
+            source_path = Path(file_path)
+            cache_path = source_path.with_name(source_path.name + '.parquet')
+            
+            # Reuse the already-cleaned Parquet sidecar if it is up to date
+            if is_excel and self._is_cache_fresh(file_path, cache_path):
+                df = self._read_cache(cache_path)
+                if df is not None:
+                    self.logger.info(f"Loaded cached {cache_path}")
+                    return df
+            
+            if is_excel:
+                df = self._read_excel(file_path)
             else:
-                df = pd.read_csv(file_path, encoding='utf-8')
+                df = self._read_csv(file_path)
             
             # Basic cleaning
             df = self.clean_dataframe(df)
             df = self.standardize_column_names(df)
             
+            if is_excel:
+                self._write_cache(df, cache_path)
+            
             self.logger.info(f"Successfully processed {file_path}")
             return df
             
@@ -105,6 +215,105 @@ class TuikDataProcessor(DataProcessor):
             self.logger.error(f"Error processing {file_path}: {str(e)}")
             raise
     
+    def _read_excel(self, file_path: Union[str, Path]) -> pd.DataFrame:
+        """
+        Read an Excel file, preferring the calamine engine when available.
+        
+        Args:
+            file_path: Path to the Excel file
+            
+        Returns:
+            Raw dataframe
+        """
+        try:
+            return pd.read_excel(file_path, engine='calamine', **_READ_KWARGS)
+        except (ImportError, ValueError):
+            # python-calamine not installed or pandas too old to know the engine
+            return pd.read_excel(file_path, **_READ_KWARGS)
+    
+    def _read_csv(self, file_path: Union[str, Path]) -> pd.DataFrame:
+        """
+        Read a CSV file with the pyarrow parser into Arrow-backed columns.
+        
+        Args:
+            file_path: Path to the CSV file
+            
+        Returns:
+            Raw dataframe
+        """
+        try:
+            return pd.read_csv(file_path, encoding='utf-8', engine='pyarrow', **_READ_KWARGS)
+        except _CSV_FALLBACK_ERRORS:
+            # pyarrow not installed or the file needs the default parser
+            return pd.read_csv(file_path, encoding='utf-8', **_READ_KWARGS)
+    
+    @staticmethod
+    def _is_cache_fresh(file_path: Union[str, Path], cache_path: Path) -> bool:
+        """
+        Check whether a Parquet sidecar exists and is newer than its source.
+        
+        Args:
+            file_path: Path to the source file
+            cache_path: Path to the Parquet sidecar
+            
+        Returns:
+            True if the cache can be used, False otherwise
+        """
+        try:
+            return cache_path.stat().st_mtime >= Path(file_path).stat().st_mtime
+        except FileNotFoundError:
+            return False
+    
+    def _read_cache(self, cache_path: Path) -> Optional[pd.DataFrame]:
+        """
+        Read a Parquet sidecar.
+        
+        Args:
+            cache_path: Path to the Parquet sidecar
+            
+        Returns:
+            Cached dataframe, or None if the sidecar cannot be read
+        """
+        try:
+            # No dtype_backend: the stored pandas metadata restores the exact
+            # dtypes of the frame that was cached
+            df = pd.read_parquet(cache_path, engine='pyarrow')
+            # ...except Arrow-backed strings, which pandas restores as StringDtype
+            pandas_metadata = pq.read_schema(cache_path).pandas_metadata or {}
+            for col in pandas_metadata.get('columns', []):
+                name = col['name']
+                if (col['numpy_type'] == 'string[pyarrow]' and name in df.columns
+                        and not isinstance(df[name].dtype, pd.ArrowDtype)):
+                    df[name] = df[name].astype(pd.ArrowDtype(pa.string()))
+            return df
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable cache {cache_path}: {str(e)}")
+            return None
+    
+    def _write_cache(self, df: pd.DataFrame, cache_path: Path) -> None:
+        """
+        Write a processed dataframe to its Parquet sidecar.
+        
+        The file is written to a temporary name and moved into place, so an
+        interrupted or concurrent write never leaves a truncated sidecar.
+        Failures are logged and ignored, the cache is only an optimization.
+        
+        Args:
+            df: Processed dataframe
+            cache_path: Path to the Parquet sidecar
+        """
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent,
+                                            prefix=cache_path.name + '.', suffix='.tmp')
+            os.close(fd)
+            df.to_parquet(tmp_path, engine='pyarrow', compression='zstd')
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            self.logger.warning(f"Could not write cache {cache_path}: {str(e)}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
     def aggregate_regional_data(self, df: pd.DataFrame, 
                               value_col: str, 
                               region_col: str = 'province') -> pd.DataFrame:
@@ -119,4 +328,56 @@ class TuikDataProcessor(DataProcessor):
         Returns:
             Aggregated dataframe
         """
-        return df.groupby(region_col)[value_col].agg(['sum', 'mean', 'std']).reset_index()
+        # Group on integer province codes instead of hashing region strings
+        codes = province_codes(df[region_col])
+        unmatched = codes < 0
+        if unmatched.any() and df[region_col].notna().to_numpy()[unmatched].any():
+            # Not (only) province names, e.g. geographic regions
+            regions = df[region_col].astype('category')
+            return (df.groupby(regions, observed=True)[value_col]
+                      .agg(['sum', 'mean', 'std'])
+                      .reset_index())
+        
+        if (_HAVE_NUMBA and len(df) >= _NUMBA_MIN_SIZE
+                and pd.api.types.is_numeric_dtype(df[value_col])
+                and not pd.api.types.is_bool_dtype(df[value_col])):
+            return self._aggregate_provinces(codes, df[value_col], region_col)
+        
+        # Plain ndarray keys avoid the categorical groupby overhead on small tables
+        result = df[value_col].groupby(codes).agg(['sum', 'mean', 'std'])
+        result = result[result.index >= 0]
+        present = result.index.to_numpy()
+        result = result.reset_index(drop=True)
+        result.insert(0, region_col, pd.Categorical.from_codes(present, dtype=PROVINCE_DTYPE))
+        return result
+    
+    @staticmethod
+    def _aggregate_provinces(codes: np.ndarray,
+                             values: pd.Series,
+                             region_col: str) -> pd.DataFrame:
+        """
+        Aggregate values per province with the fixed-size numba kernel.
+        
+        Args:
+            codes: PROVINCE_DTYPE category codes, -1 for missing provinces
+            values: Numeric values to aggregate
+            region_col: Name of the region column in the result
+            
+        Returns:
+            Aggregated dataframe, same layout as the groupby path
+        """
+        rows, sums, means, stds = _province_agg(
+            codes,
+            values.to_numpy(dtype=np.float64, na_value=np.nan),
+            len(PROVINCE_DTYPE.categories)
+        )
+        present = np.flatnonzero(rows)
+        result = pd.DataFrame({
+            region_col: pd.Categorical.from_codes(present, dtype=PROVINCE_DTYPE),
+            'sum': sums[present],
+            'mean': means[present],
+            'std': stds[present]
+        })
+        if pd.api.types.is_integer_dtype(values):
+            result['sum'] = result['sum'].astype(values.dtype)
+        return result
@@ -3,13 +3,78 @@ Utility functions for AgroDataZoom project.
 """
 
 import os
+import sys
+import math
 import json
 import logging
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Any, Optional, Union
+from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
+import numpy as np
 import pandas as pd
 
+def _json_default(obj: Any) -> Any:
+    """Serialize values JSON does not know, identically for orjson and json."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, (datetime, date)):
+        # Also covers pd.Timestamp, which orjson does not serialize natively
+        return obj.isoformat()
+    return str(obj)
+
+def _nan_to_none(obj: Any) -> Any:
+    """Replace NaN/inf floats (numpy ones included) with None, as orjson writes them as null."""
+    if isinstance(obj, np.ndarray):
+        obj = obj.tolist()
+    elif isinstance(obj, np.generic):
+        obj = obj.item()
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _nan_to_none(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_nan_to_none(v) for v in obj]
+    return obj
+
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_json_default,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(_nan_to_none(obj), indent=2, ensure_ascii=False,
+                          allow_nan=False, default=_json_default).encode('utf-8')
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    _HAVE_ARROW = True
+except ImportError:
+    _HAVE_ARROW = False
+
+__all__ = [
+    "setup_logging",
+    "create_metadata",
+    "save_metadata",
+    "create_metadata_many",
+    "save_metadata_many",
+    "get_data_summary",
+    "ensure_directory",
+    "validate_file_exists",
+    "get_file_extension",
+    "normalize_province",
+    "province_codes",
+    "match_province_fast",
+    "TURKEY_PROVINCES",
+    "PROVINCE_DTYPE",
+]
+
 def setup_logging(log_level: str = "INFO") -> logging.Logger:
     """
     Setup logging configuration.
@@ -43,18 +108,15 @@ def create_metadata(file_path: Union[str, Path],
     Returns:
         Metadata dictionary
     """
-    metadata = {
-        "file_path": str(file_path),
+    file_path = os.fspath(file_path)
+    return {
+        "file_path": file_path,
         "source": source,
         "description": description,
         "created_date": datetime.now().isoformat(),
-        "file_size_mb": round(Path(file_path).stat().st_size / (1024 * 1024), 2)
+        "file_size_mb": round(os.stat(file_path).st_size / (1024 * 1024), 2),
+        **(additional_info or {})
     }
-    
-    if additional_info:
-        metadata.update(additional_info)
-    
-    return metadata
 
 def save_metadata(metadata: Dict[str, Any], output_path: Union[str, Path]) -> None:
     """
@@ -64,8 +126,44 @@ def save_metadata(metadata: Dict[str, Any], output_path: Union[str, Path]) -> No
         metadata: Metadata dictionary
         output_path: Path where to save the metadata file
     """
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, indent=2, ensure_ascii=False)
+    with open(output_path, 'wb') as f:
+        f.write(_dumps(metadata))
+
+def create_metadata_many(file_paths: Iterable[Union[str, Path]],
+                         source: str,
+                         description: str,
+                         additional_info: Optional[Dict[str, Any]] = None,
+                         workers: int = 8) -> List[Dict[str, Any]]:
+    """
+    Create metadata for many datasets, overlapping the file system calls.
+    
+    Args:
+        file_paths: Paths to the data files
+        source: Data source information
+        description: Description of the datasets
+        additional_info: Additional metadata information
+        workers: Number of worker threads
+        
+    Returns:
+        List of metadata dictionaries, in the order of file_paths
+    """
+    create = partial(create_metadata, source=source, description=description,
+                     additional_info=additional_info)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(create, file_paths))
+
+def save_metadata_many(items: Iterable[Tuple[Dict[str, Any], Union[str, Path]]],
+                       workers: int = 8) -> None:
+    """
+    Save many metadata dictionaries to JSON files in parallel.
+    
+    Args:
+        items: Pairs of (metadata, output_path)
+        workers: Number of worker threads
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Consume the iterator so worker exceptions are raised here
+        list(executor.map(lambda item: save_metadata(*item), items))
 
 def get_data_summary(df: pd.DataFrame) -> Dict[str, Any]:
     """
@@ -77,6 +175,16 @@ def get_data_summary(df: pd.DataFrame) -> Dict[str, Any]:
     Returns:
         Summary statistics dictionary
     """
+    if _HAVE_ARROW:
+        try:
+            summary = _get_data_summary_arrow(df)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError, ValueError):
+            # Mixed-type object columns or duplicate column names cannot be
+            # converted, use the pandas path
+            summary = None
+        if summary is not None:
+            return summary
+    
     summary = {
         "shape": df.shape,
         "columns": list(df.columns),
@@ -87,6 +195,55 @@ def get_data_summary(df: pd.DataFrame) -> Dict[str, Any]:
     
     return summary
 
+def _as_float(value: Any) -> float:
+    """Convert an Arrow statistic to float, undefined (null) results become NaN."""
+    return float('nan') if value is None else float(value)
+
+def _get_data_summary_arrow(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
+    """
+    Generate the get_data_summary dictionary with pyarrow compute kernels.
+    
+    Args:
+        df: Input dataframe
+        
+    Returns:
+        Summary statistics dictionary, or None if the frame has date/time
+        columns, which describe() summarizes and are left to the pandas path
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if any(pa.types.is_temporal(col.type) for col in table.columns):
+        return None
+    
+    missing_values = {}
+    numeric_summary = {}
+    
+    for name, col in zip(df.columns, table.columns):
+        # Null counts are tracked by Arrow, NaN/None/NaT are nulls after conversion
+        missing_values[name] = col.null_count
+        if not (pa.types.is_integer(col.type) or pa.types.is_floating(col.type)):
+            continue
+        
+        min_max = pc.min_max(col)
+        quartiles = pc.quantile(col, q=[0.25, 0.5, 0.75]).to_pylist() or [None] * 3
+        numeric_summary[name] = {
+            "count": float(len(col) - col.null_count),
+            "mean": _as_float(pc.mean(col).as_py()),
+            "std": _as_float(pc.stddev(col, ddof=1).as_py()),
+            "min": _as_float(min_max["min"].as_py()),
+            "25%": _as_float(quartiles[0]),
+            "50%": _as_float(quartiles[1]),
+            "75%": _as_float(quartiles[2]),
+            "max": _as_float(min_max["max"].as_py()),
+        }
+    
+    return {
+        "shape": df.shape,
+        "columns": list(df.columns),
+        "data_types": df.dtypes.to_dict(),
+        "missing_values": missing_values,
+        "numeric_summary": numeric_summary
+    }
+
 def ensure_directory(path: Union[str, Path]) -> Path:
     """
     Ensure a directory exists, create if it doesn't.
@@ -209,3 +366,61 @@ TURKEY_PROVINCES = {
     'osmaniye': 'Osmaniye',
     'duzce': 'Düzce'
 }
+
+# Categorical dtype over the canonical province names; stores provinces as small integer codes
+PROVINCE_DTYPE = pd.CategoricalDtype(categories=sorted(set(TURKEY_PROVINCES.values())), ordered=False)
+
+# Turkish letters folded to the ASCII spelling used by the TURKEY_PROVINCES keys
+_PROVINCE_TRANS = str.maketrans('ÇĞİÖŞÜÂçğıöşüâ', 'CGIOSUAcgiosua')
+_PROVINCE_LOOKUP = {sys.intern(k): v for k, v in TURKEY_PROVINCES.items()}
+
+def match_province_fast(name: Any) -> Optional[str]:
+    """
+    Match a province name to its canonical spelling.
+    
+    Args:
+        name: Province name in any case, with or without Turkish characters
+        
+    Returns:
+        Canonical province name, or None if it is not a known province
+    """
+    if not isinstance(name, str):
+        return None
+    return _PROVINCE_LOOKUP.get(name.strip().translate(_PROVINCE_TRANS).lower())
+
+def province_codes(s: pd.Series) -> np.ndarray:
+    """
+    Map province names to PROVINCE_DTYPE category codes.
+    
+    Args:
+        s: Series of province names (any case, with or without Turkish characters)
+        
+    Returns:
+        Integer array of category codes, -1 for missing or unknown names
+    """
+    if s.dtype == PROVINCE_DTYPE:
+        return s.cat.codes.to_numpy()
+    
+    # Match each distinct name once, then broadcast through the factorized codes
+    codes, uniques = pd.factorize(s)
+    unique_codes = PROVINCE_DTYPE.categories.get_indexer(uniques)
+    if (unique_codes < 0).any():
+        # Not all canonical already, fold case and Turkish characters
+        unique_codes = PROVINCE_DTYPE.categories.get_indexer(
+            [match_province_fast(name) for name in uniques])
+    # Trailing -1 so missing values (code -1) stay missing
+    unique_codes = np.append(unique_codes, -1)
+    return unique_codes[codes]
+
+def normalize_province(s: pd.Series) -> pd.Series:
+    """
+    Map province names to their canonical spelling as a categorical series.
+    
+    Args:
+        s: Series of province names (any case, with or without Turkish characters)
+        
+    Returns:
+        Series with PROVINCE_DTYPE, unknown names become NaN
+    """
+    return pd.Series(pd.Categorical.from_codes(province_codes(s), dtype=PROVINCE_DTYPE),
+                     index=s.index, name=s.name)
@@ -2,17 +2,36 @@
 Visualization utilities for AgroDataZoom project.
 """
 
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from __future__ import annotations
+
+import functools
 import pandas as pd
 import numpy as np
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Tuple, TYPE_CHECKING
+
+# Plotting libraries are imported inside the functions that use them to keep
+# `import` of this module cheap for data-processing-only callers.
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+    import plotly.graph_objects as go
 
 from ..config.config import VIZ_CONFIG
 
+@functools.lru_cache(maxsize=None)
+def _apply_style(style: str, palette: str, figure_size: Tuple[int, int],
+                 dpi: int, font_size: int) -> None:
+    """Apply global plotting style once per distinct set of settings."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
+    plt.style.use(style)
+    sns.set_palette(palette)
+    plt.rcParams.update({
+        'figure.figsize': figure_size,
+        'figure.dpi': dpi,
+        'font.size': font_size
+    })
+
 class AgroVisualizer:
     """Main visualization class for agricultural data."""
     
@@ -22,11 +41,11 @@ class AgroVisualizer:
     
     def setup_style(self):
         """Setup default visualization style."""
-        plt.style.use(self.config["style"])
-        sns.set_palette(self.config["color_palette"])
-        plt.rcParams['figure.figsize'] = self.config["figure_size"]
-        plt.rcParams['figure.dpi'] = self.config["dpi"]
-        plt.rcParams['font.size'] = self.config["font_size"]
+        _apply_style(self.config["style"],
+                     self.config["color_palette"],
+                     tuple(self.config["figure_size"]),
+                     self.config["dpi"],
+                     self.config["font_size"])
     
     def plot_time_series(self, df: pd.DataFrame, 
                         x_col: str, 
@@ -46,6 +65,8 @@ class AgroVisualizer:
         Returns:
             Matplotlib figure object
         """
+        import matplotlib.pyplot as plt
+        
         fig, ax = plt.subplots(figsize=self.config["figure_size"])
         
         ax.plot(df[x_col], df[y_col], linewidth=2, marker='o', markersize=4)
@@ -77,12 +98,23 @@ class AgroVisualizer:
         Returns:
             Plotly figure object
         """
-        fig = px.bar(df, x=region_col, y=value_col, 
-                    title=title,
-                    labels={region_col: region_col.replace('_', ' ').title(),
-                           value_col: value_col.replace('_', ' ').title()})
+        import plotly.graph_objects as go
+        
+        x_label = region_col.replace('_', ' ').title()
+        y_label = value_col.replace('_', ' ').title()
+        
+        # Build the trace directly, skipping Plotly Express data inference
+        fig = go.Figure(data=[go.Bar(
+            x=df[region_col].to_numpy(),
+            y=df[value_col].to_numpy(),
+            name=value_col,
+            hovertemplate=f"{x_label}=%{{x}}<br>{y_label}=%{{y}}<extra></extra>"
+        )])
         
         fig.update_layout(
+            title=title,
+            xaxis_title=x_label,
+            yaxis_title=y_label,
             xaxis_tickangle=-45,
             height=600,
             showlegend=False
@@ -104,15 +136,39 @@ class AgroVisualizer:
         Returns:
             Matplotlib figure object
         """
-        if columns:
-            corr_data = df[columns].corr()
+        import matplotlib.pyplot as plt
+        
+        data = df[columns] if columns else df.select_dtypes(include=[np.number])
+        values = data.to_numpy(dtype=np.float64, na_value=np.nan)
+        
+        if values.shape[1] >= 2 and not np.isnan(values).any():
+            # Single BLAS-backed pass over the raw array
+            with np.errstate(divide='ignore', invalid='ignore'):
+                corr = np.corrcoef(values, rowvar=False)
+            corr_data = pd.DataFrame(corr, index=data.columns, columns=data.columns)
         else:
-            corr_data = df.select_dtypes(include=[np.number]).corr()
+            # Pairwise-complete correlations for missing values and trivial inputs
+            corr_data = data.corr()
         
         fig, ax = plt.subplots(figsize=(10, 8))
         
-        sns.heatmap(corr_data, annot=True, cmap='coolwarm', center=0,
-                   square=True, ax=ax, cbar_kws={'shrink': 0.8})
+        corr = corr_data.to_numpy()
+        k = corr.shape[0]
+        im = ax.imshow(corr, cmap='coolwarm', vmin=-1, vmax=1, aspect='equal')
+        fig.colorbar(im, ax=ax, shrink=0.8)
+        ax.set_xticks(range(k))
+        ax.set_xticklabels(corr_data.columns, rotation=45, ha='right')
+        ax.set_yticks(range(k))
+        ax.set_yticklabels(corr_data.columns)
+        
+        # Per-cell text artists are only readable (and cheap) on small matrices
+        if k <= 15:
+            for idx, value in enumerate(corr.flat):
+                if np.isnan(value):
+                    continue
+                i, j = divmod(idx, k)
+                ax.text(j, i, f"{value:.2g}", ha='center', va='center',
+                        color='white' if abs(value) > 0.5 else 'black')
         
         ax.set_title(title, fontsize=16, fontweight='bold')
         plt.tight_layout()
@@ -137,6 +193,8 @@ class TurkeyVisualizer(AgroVisualizer):
         Returns:
             Plotly figure object
         """
+        import plotly.graph_objects as go
+        
         # This is a placeholder - actual implementation would require
         # Turkey province geojson data
         fig = go.Figure(data=go.Scatter(